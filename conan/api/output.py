@@ -1,4 +1,6 @@
 import sys
+import threading
+from contextlib import contextmanager
 
 from colorama import Fore, Style
 
@@ -51,6 +53,7 @@ class ConanOutput:
     # Singleton
     _conan_output_level = LEVEL_STATUS
     _silent_warn_tags = []
+    _thread_output = threading.local()  # Output of background threads, to be written later
 
     def __init__(self, scope=""):
         self.stream = sys.stderr
@@ -58,6 +61,20 @@ class ConanOutput:
         # FIXME:  This is needed because in testing we are redirecting the sys.stderr to a buffer
         #         stream to capture it, so colorama is not there to strip the color bytes
         self._color = color_enabled(self.stream)
+        redirected = getattr(self._thread_output, "stream", None)
+        if redirected is not None:  # Colors are still those of sys.stderr, where it will end
+            self.stream = redirected
+
+    @classmethod
+    @contextmanager
+    def redirect_thread(cls, stream):
+        """ Redirect the output of the current thread only to the given stream
+        """
+        cls._thread_output.stream = stream
+        try:
+            yield
+        finally:
+            cls._thread_output.stream = None
 
     @classmethod
     def define_silence_warnings(cls, warnings):
@@ -1,5 +1,3 @@
-from collections import OrderedDict
-
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 
@@ -33,6 +31,8 @@ CONTEXT_BUILD = "build"
 
 
 class TransitiveRequirement:
+    __slots__ = ("require", "node")
+
     def __init__(self, require, node):
         self.require = require
         self.node = node
@@ -42,6 +42,12 @@ class TransitiveRequirement:
 
 
 class Node(object):
+    # Many nodes are created in big graphs, __slots__ saves memory and speeds attribute access
+    __slots__ = ("ref", "path", "_package_id", "prev", "pref_timestamp", "conanfile", "binary",
+                 "recipe", "remote", "binary_remote", "context", "test", "test_package",
+                 "transitive_deps", "dependencies", "dependants", "error", "cant_build",
+                 "should_build", "id")
+
     def __init__(self, ref, conanfile, context, recipe=None, path=None, test=False):
         self.ref = ref
         self.path = path  # path to the consumer conanfile.xx for consumer, None otherwise
@@ -61,7 +67,7 @@ class Node(object):
         self.test_package = False  # True if it is a test_package only package
 
         # real graph model
-        self.transitive_deps = OrderedDict()  # of _TransitiveRequirement
+        self.transitive_deps = {}  # of _TransitiveRequirement
         self.dependencies = []  # Ordered Edges
         self.dependants = []  # Edges
         self.error = None
@@ -87,91 +93,97 @@ class Node(object):
     def propagate_downstream(self, require, node, src_node=None):
         # print("  Propagating downstream ", self, "<-", require)
         assert node is not None
-        # This sets the transitive_deps node if it was None (overrides)
-        # Take into account that while propagating we can find RUNTIME shared conflicts we
-        # didn't find at check_downstream_exist, because we didn't know the shared/static
-        existing = self.transitive_deps.get(require)
-        if existing is not None and existing.require is not require:
-            if existing.node is not None and existing.node.ref != node.ref:
-                # print("  +++++Runtime conflict!", require, "with", node.ref)
-                return True
-            require.aggregate(existing.require)
-
-        assert not require.version_range  # No ranges slip into transitive_deps definitions
-        # TODO: Might need to move to an update() for performance
-        self.transitive_deps.pop(require, None)
-        self.transitive_deps[require] = TransitiveRequirement(require, node)
-
-        # Check if need to propagate downstream
-        if not self.dependants:
-            return
-
-        if src_node is not None:  # This happens when closing a loop, and we need to know the edge
-            d = [d for d in self.dependants if d.src is src_node][0]  # TODO: improve ugly
-        else:
-            assert len(self.dependants) == 1
-            d = self.dependants[0]
+        # Iterative (not recursive) walk down the single dependants chain, so deep graphs
+        # do not hit the Python recursion limit
+        current = self
+        while True:
+            # This sets the transitive_deps node if it was None (overrides)
+            # Take into account that while propagating we can find RUNTIME shared conflicts we
+            # didn't find at check_downstream_exist, because we didn't know the shared/static
+            existing = current.transitive_deps.get(require)
+            if existing is not None:
+                if existing.require is not require:
+                    if existing.node is not None and existing.node.ref != node.ref:
+                        # print("  +++++Runtime conflict!", require, "with", node.ref)
+                        return True
+                    require.aggregate(existing.require)
+                # Remove it, so it is re-inserted at the end, keeping the closure order
+                current.transitive_deps.pop(require)
+
+            assert not require.version_range  # No ranges slip into transitive_deps definitions
+            current.transitive_deps[require] = TransitiveRequirement(require, node)
+
+            # Check if need to propagate downstream
+            if not current.dependants:
+                return
+
+            if src_node is not None:  # This happens when closing a loop, and we need the edge
+                d = [d for d in current.dependants if d.src is src_node][0]  # TODO: improve ugly
+                src_node = None
+            else:
+                assert len(current.dependants) == 1
+                d = current.dependants[0]
 
-        down_require = d.require.transform_downstream(self.conanfile.package_type, require,
-                                                      node.conanfile.package_type)
-        if down_require is None:
-            return
+            down_require = d.require.transform_downstream(current.conanfile.package_type, require,
+                                                          node.conanfile.package_type)
+            if down_require is None:
+                return
 
-        return d.src.propagate_downstream(down_require, node)
+            current, require = d.src, down_require
 
     def check_downstream_exists(self, require):
-        # First, a check against self, could be a loop-conflict
-        # This is equivalent as the Requirement hash and eq methods
-        # TODO: Make self.ref always exist, but with name=None if name not defined
-        if self.ref is not None and require.ref.name == self.ref.name:
-            if require.build and (self.context == CONTEXT_HOST or  # switch context
-                                  require.ref.version != self.ref.version):  # or different version
-                pass
-            else:
-                return None, self, self  # First is the require, as it is a loop => None
-
-        # First do a check against the current node dependencies
-        prev = self.transitive_deps.get(require)
-        # print("    Transitive deps", self.transitive_deps)
-        # ("    THERE IS A PREV ", prev, "in node ", self, " for require ", require)
-        # Overrides: The existing require could be itself, that was just added
         result = None
-        if prev and (prev.require is not require or prev.node is not None):
-            result = prev.require, prev.node, self
-            # Do not return yet, keep checking downstream, because downstream overrides or forces
-            # have priority
-
-        # Check if need to propagate downstream
-        # Then propagate downstream
-
-        # Seems the algrithm depth-first, would only have 1 dependant at most to propagate down
-        # at any given time
-        if not self.dependants:
-            return result
-        assert len(self.dependants) == 1
-        dependant = self.dependants[0]
-
-        # TODO: Implement an optimization where the requires is checked against a graph global
-        # print("    Lets check_downstream one more")
-        down_require = dependant.require.transform_downstream(self.conanfile.package_type,
-                                                              require, None)
-
-        if down_require is None:
-            # print("    No need to check downstream more")
-            return result
-
-        source_node = dependant.src
-        return source_node.check_downstream_exists(down_require) or result
+        current = self
+        while True:
+            # First, a check against self, could be a loop-conflict
+            # This is equivalent as the Requirement hash and eq methods
+            # TODO: Make self.ref always exist, but with name=None if name not defined
+            if current.ref is not None and require.ref.name == current.ref.name:
+                if require.build and (current.context == CONTEXT_HOST or  # switch context
+                                      require.ref.version != current.ref.version):  # or version
+                    pass
+                else:
+                    return None, current, current  # First is the require, as it is a loop => None
+
+            # First do a check against the current node dependencies
+            prev = current.transitive_deps.get(require)
+            # print("    Transitive deps", current.transitive_deps)
+            # ("    THERE IS A PREV ", prev, "in node ", current, " for require ", require)
+            # Overrides: The existing require could be itself, that was just added
+            if prev and (prev.require is not require or prev.node is not None):
+                result = prev.require, prev.node, current
+                # Do not return yet, keep checking downstream, because downstream overrides or
+                # forces have priority
+
+            # Check if need to propagate downstream
+            # Then propagate downstream
+
+            # Seems the algrithm depth-first, would only have 1 dependant at most to propagate down
+            # at any given time
+            if not current.dependants:
+                return result
+            assert len(current.dependants) == 1
+            dependant = current.dependants[0]
+
+            # print("    Lets check_downstream one more")
+            down_require = dependant.require.transform_downstream(current.conanfile.package_type,
+                                                                  require, None)
+
+            if down_require is None:
+                # print("    No need to check downstream more")
+                return result
+
+            current, require = dependant.src, down_require
 
     def check_loops(self, new_node):
-        if self.ref == new_node.ref and self.context == new_node.context:
-            return self
-        if not self.dependants:
-            return
-        assert len(self.dependants) == 1
-        dependant = self.dependants[0]
-        source_node = dependant.src
-        return source_node.check_loops(new_node)
+        current = self
+        while True:
+            if current.ref == new_node.ref and current.context == new_node.context:
+                return current
+            if not current.dependants:
+                return
+            assert len(current.dependants) == 1
+            current = current.dependants[0].src
 
     @property
     def package_id(self):
@@ -208,7 +220,7 @@ class Node(object):
         return repr(self.conanfile)
 
     def serialize(self):
-        result = OrderedDict()
+        result = {}
         result["ref"] = self.ref.repr_notime() if self.ref is not None else "conanfile"
         result["id"] = getattr(self, "id")  # Must be assigned by graph.serialize()
         result["recipe"] = self.recipe
@@ -230,14 +242,14 @@ class Node(object):
     def overrides(self):
 
         def transitive_subgraph():
-            result = set()
-            opened = {self}
+            result = {self}
+            opened = [self]
             while opened:
-                new_opened = set()
-                for o in opened:
-                    result.add(o)
-                    new_opened.update(set(o.neighbors()).difference(result))
-                opened = new_opened
+                o = opened.pop()
+                for n in o.neighbors():
+                    if n not in result:
+                        result.add(n)
+                        opened.append(n)
 
             return result
 
@@ -246,6 +258,8 @@ class Node(object):
 
 
 class Edge(object):
+    __slots__ = ("src", "dst", "require")
+
     def __init__(self, src, dst, require):
         self.src = src
         self.dst = dst
@@ -311,9 +325,11 @@ class Overrides:
 class DepsGraph(object):
     def __init__(self):
         self.nodes = []
+        self._nodes_set = set()  # Same as nodes, for fast membership checks
         self.aliased = {}
         self.resolved_ranges = {}
         self.error = False
+        self._names = {}  # {name: count} of nodes and declared requires, to skip conflict checks
 
     def overrides(self):
         return Overrides.create(self.nodes)
@@ -327,9 +343,21 @@ class DepsGraph(object):
 
     def add_node(self, node):
         self.nodes.append(node)
+        self._nodes_set.add(node)
+        if node.name is not None:
+            self.add_name(node.name)
+
+    def add_name(self, name):
+        self._names[name] = self._names.get(name, 0) + 1
+
+    def unique_name(self, name):
+        """ True if the name has been declared only once, by a single requirement, and there
+        is still no node with such name in the graph, so it cannot conflict with anything
+        """
+        return self._names.get(name) == 1
 
     def add_edge(self, src, dst, require):
-        assert src in self.nodes and dst in self.nodes
+        assert src in self._nodes_set and dst in self._nodes_set
         edge = Edge(src, dst, require)
         src.add_edge(edge)
         dst.add_edge(edge)
@@ -347,22 +375,25 @@ class DepsGraph(object):
         return [[node1, node34], [node3], [node23, node8],...]
         """
         result = []
-        # We make it a dict to preserve insertion order and be deterministic, s
-        # sets are not deterministic order. dict is fast for look up operations
-        opened = dict.fromkeys(self.nodes)
-        while opened:
-            current_level = []
-            for o in opened:
-                o_neighs = o.neighbors()
-                if not any(n in opened for n in o_neighs):
-                    current_level.append(o)
-
+        # Topological order (Kahn), counting for every node its pending dependencies, instead of
+        # scanning all the remaining nodes for every level
+        index = {n: i for i, n in enumerate(self.nodes)}
+        pending = {n: len(set(n.neighbors())) for n in self.nodes}
+        current_level = [n for n in self.nodes if not pending[n]]
+        while current_level:
             # TODO: SORTING seems only necessary for test order
             current_level.sort()
             result.append(current_level)
-            # now start new level, removing the current level items
+            next_level = []
             for item in current_level:
-                opened.pop(item)
+                for dependant in set(item.inverse_neighbors()):
+                    pending[dependant] -= 1
+                    if not pending[dependant]:
+                        next_level.append(dependant)
+            # Keep the graph insertion order for nodes that are equal for the sort, to be
+            # deterministic
+            next_level.sort(key=index.get)
+            current_level = next_level
 
         return result
 
@@ -380,7 +411,7 @@ class DepsGraph(object):
     def serialize(self):
         for i, n in enumerate(self.nodes):
             n.id = i
-        result = OrderedDict()
+        result = {}
         result["nodes"] = [n.serialize() for n in self.nodes]
         result["root"] = {self.root.id: repr(self.root.ref)}  # TODO: ref of consumer/virtual
         return result
@@ -1,9 +1,12 @@
 import copy
 from collections import deque
+from io import StringIO
+from multiprocessing.pool import ThreadPool
 
+from conan.api.output import ConanOutput
 from conans.client.conanfile.configure import run_configure_method
 from conans.client.graph.graph import DepsGraph, Node, CONTEXT_HOST, \
-    CONTEXT_BUILD, TransitiveRequirement, RECIPE_VIRTUAL
+    CONTEXT_BUILD, TransitiveRequirement, RECIPE_VIRTUAL, RECIPE_DOWNLOADED
 from conans.client.graph.graph import RECIPE_SYSTEM_TOOL
 from conans.client.graph.graph_error import GraphLoopError, GraphConflictError, GraphMissingError, \
     GraphRuntimeError, GraphError
@@ -16,6 +19,21 @@ from conans.model.recipe_ref import RecipeReference, ref_matches
 from conans.model.requires import Requirement
 
 
+def _conflicting_refs(ref1, ref2):
+    if ref1 is ref2:  # Same object, nothing to compare
+        return False
+    # Compare without revisions, without allocating revision-less copies of the refs
+    if (ref1.name, ref1.version, ref1.user, ref1.channel) != \
+            (ref2.name, ref2.version, ref2.user, ref2.channel):
+        return True
+    # Computed node, if is Editable, has revision=None
+    # If new_ref.revision is None we cannot assume any conflict, user hasn't specified
+    # a revision, so it's ok any previous_ref
+    if ref1.revision and ref2.revision and ref1.revision != ref2.revision:
+        return True
+    return False
+
+
 class DepsGraphBuilder(object):
 
     def __init__(self, proxy, loader, resolver, cache, remotes, update, check_update):
@@ -27,6 +45,8 @@ class DepsGraphBuilder(object):
         self._update = update
         self._check_update = check_update
         self._resolve_prereleases = self._cache.new_config.get('core.version_ranges:resolve_prereleases')
+        self._prefetch_pool = None
+        self._prefetched = {}  # {name: (ref, output, AsyncResult)} of recipes resolved in advance
 
     def load_graph(self, root_node, profile_host, profile_build, graph_lock=None):
         assert profile_host is not None
@@ -40,8 +60,12 @@ class DepsGraphBuilder(object):
         self._initialize_requires(root_node, dep_graph, graph_lock)
         dep_graph.add_node(root_node)
 
+        parallel = self._cache.new_config.get("core.graph:parallel_recipes", check_type=int)
+        if parallel and graph_lock is None:  # Locked references are only known when expanding
+            self._prefetch_pool = ThreadPool(parallel)
         open_requires = deque((r, root_node) for r in root_node.conanfile.requires.values())
         try:
+            self._prefetch_recipes(root_node, dep_graph)
             while open_requires:
                 # Fetch the first waiting to be expanded (depth-first)
                 (require, node) = open_requires.popleft()
@@ -51,6 +75,7 @@ class DepsGraphBuilder(object):
                                                 profile_build, graph_lock)
                 if new_node:
                     self._initialize_requires(new_node, dep_graph, graph_lock)
+                    self._prefetch_recipes(new_node, dep_graph)
                     open_requires.extendleft((r, new_node)
                                              for r in reversed(new_node.conanfile.requires.values()))
             self._remove_overrides(dep_graph)
@@ -58,6 +83,12 @@ class DepsGraphBuilder(object):
             self._compute_test_package_deps(dep_graph)
         except GraphError as e:
             dep_graph.error = e
+        finally:
+            if self._prefetch_pool is not None:
+                self._prefetch_pool.close()
+                self._prefetch_pool.join()
+                self._prefetch_pool = None
+                self._prefetched = {}
         dep_graph.resolved_ranges = self._resolver.resolved_ranges
         return dep_graph
 
@@ -67,7 +98,12 @@ class DepsGraphBuilder(object):
         #    node -(require)-> previous (creates a diamond with a previously existing node)
         # TODO: allow bootstrapping, use references instead of names
         # print("  Expanding require ", node, "->", require)
-        previous = node.check_downstream_exists(require)
+        # A require whose name is unique in the graph can't close a diamond or a loop, no need
+        # to traverse the graph downstream looking for it
+        if graph.unique_name(require.ref.name):
+            previous = None
+        else:
+            previous = node.check_downstream_exists(require)
         prev_node = None
         if previous is not None:
             prev_require, prev_node, base_previous = previous
@@ -118,19 +154,6 @@ class DepsGraphBuilder(object):
             if not prev_version_range.contains(require.ref.version, resolve_prereleases):
                 raise GraphConflictError(node, require, prev_node, prev_require, base_previous)
         else:
-            def _conflicting_refs(ref1, ref2):
-                ref1_norev = copy.copy(ref1)
-                ref1_norev.revision = None
-                ref2_norev = copy.copy(ref2)
-                ref2_norev.revision = None
-                if ref2_norev != ref1_norev:
-                    return True
-                # Computed node, if is Editable, has revision=None
-                # If new_ref.revision is None we cannot assume any conflict, user hasn't specified
-                # a revision, so it's ok any previous_ref
-                if ref1.revision and ref2.revision and ref1.revision != ref2.revision:
-                    return True
-
             # As we are closing a diamond, there can be conflicts. This will raise if so
             conflict = _conflicting_refs(prev_ref, require.ref)
             if conflict:  # It is possible to get conflict from alias, try to resolve it
@@ -151,12 +174,15 @@ class DepsGraphBuilder(object):
         tool_requires = profile.tool_requires
         for pattern, tool_requires in tool_requires.items():
             if ref_matches(ref, pattern, is_consumer=conanfile._conan_is_consumer):
+                ref_str = str(ref)
                 for tool_require in tool_requires:  # Do the override
-                    if str(tool_require) == str(ref):  # FIXME: Ugly str comparison
+                    if str(tool_require) == ref_str:  # FIXME: Ugly str comparison
                         continue  # avoid self-loop of build-requires in build context
-                    # FIXME: converting back to string?
-                    node.conanfile.requires.tool_require(str(tool_require),
-                                                         raise_if_duplicated=False)
+                    # A new revision-less reference, not parsed again from a string. Every
+                    # requirement needs its own, as they can be modified while expanding
+                    tool_require = RecipeReference(tool_require.name, tool_require.version,
+                                                   tool_require.user, tool_require.channel)
+                    node.conanfile.requires.tool_require(tool_require, raise_if_duplicated=False)
 
     def _initialize_requires(self, node, graph, graph_lock):
         for require in node.conanfile.requires.values():
@@ -169,6 +195,7 @@ class DepsGraphBuilder(object):
                 if not resolved:
                     self._resolve_alias(node, require, alias, graph)
             node.transitive_deps[require] = TransitiveRequirement(require, node=None)
+            graph.add_name(require.ref.name)
 
     def _resolve_alias(self, node, require, alias, graph):
         # First try cached
@@ -186,8 +213,7 @@ class DepsGraphBuilder(object):
         while alias is not None:
             # if not cached, then resolve
             try:
-                result = self._proxy.get_recipe(alias, self._remotes, self._update,
-                                                self._check_update)
+                result = self._get_recipe(alias)
                 conanfile_path, recipe_status, remote, new_ref = result
             except ConanException as e:
                 raise GraphMissingError(node, require, str(e))
@@ -201,11 +227,62 @@ class DepsGraphBuilder(object):
             # UPDATE THE REQUIREMENT!
             require.ref = pointed_ref
             graph.aliased[alias] = pointed_ref  # Caching the alias
-            new_req = Requirement(pointed_ref)  # FIXME: Ugly temp creation just for alias check
-            alias = new_req.alias
+            alias = require.alias  # The pointed reference could be an alias too
+
+    def _prefetch_recipes(self, node, graph):
+        """ Speculatively resolve, in background threads, the recipes of the regular host
+        requirements of a node that are already exact references. The result is cached by the
+        proxy, and the later expansion of the graph will use it
+        """
+        if self._prefetch_pool is None or node.context == CONTEXT_BUILD:
+            return
+        for require in node.conanfile.requires.values():
+            # build requires can be resolved to [system_tools] from the profile
+            if require.override or require.build or require.version_range or \
+                    require.ref.version == "<host_version>":
+                continue
+            # Only names declared once, nothing downstream can override or conflict with them,
+            # so the serial expansion would resolve exactly the same recipe
+            name = require.ref.name
+            if graph.unique_name(name):
+                # A copy, as the main thread can modify the requirement reference
+                ref = copy.copy(require.ref)
+                output = StringIO()
+                result = self._prefetch_pool.apply_async(self._prefetch_recipe, (ref, output))
+                self._prefetched[name] = ref, output, result
+
+    def _prefetch_recipe(self, ref, output):
+        # The output is written later, when the expansion of the graph reaches this recipe
+        with ConanOutput.redirect_thread(output):
+            return self._proxy.get_recipe(ref, self._remotes, self._update, self._check_update)
+
+    def _get_recipe(self, ref):
+        """ The recipe resolved in advance, with its output and errors, or resolve it now
+        """
+        prefetched = self._prefetched.get(ref.name)
+        if prefetched is not None and prefetched[0] == ref:
+            del self._prefetched[ref.name]
+            _, output, result = prefetched
+            result.wait()
+            ConanOutput().stream.write(output.getvalue())
+            return result.get()  # Raises the error of the background thread, if any
+        return self._proxy.get_recipe(ref, self._remotes, self._update, self._check_update)
+
+    def _hidden_prefetched(self, name):
+        """ A recipe downloaded in advance, but not reached yet by the expansion of the graph,
+        must not be visible to the version ranges, that are resolved in the cache first
+        """
+        prefetched = self._prefetched.get(name)
+        if prefetched is not None:
+            result = prefetched[2]
+            result.wait()
+            if result.successful():
+                _, recipe_status, _, new_ref = result.get()
+                if recipe_status == RECIPE_DOWNLOADED:
+                    return new_ref
 
     def _resolve_recipe(self, ref, graph_lock):
-        result = self._proxy.get_recipe(ref, self._remotes, self._update, self._check_update)
+        result = self._get_recipe(ref)
         conanfile_path, recipe_status, remote, new_ref = result
         dep_conanfile = self._loader.load_conanfile(conanfile_path, ref=ref, graph_lock=graph_lock,
                                                     remotes=self._remotes, update=self._update,
@@ -256,7 +333,10 @@ class DepsGraphBuilder(object):
                 # TODO: If it is locked not resolve range
                 # TODO: This range-resolve might resolve in a given remote or cache
                 # Make sure next _resolve_recipe use it
-                self._resolver.resolve(require, str(node.ref), self._remotes, self._update)
+                hidden = None
+                if require.version_range is not None:
+                    hidden = self._hidden_prefetched(require.ref.name)
+                self._resolver.resolve(require, node.ref, self._remotes, self._update, hidden)
                 resolved = self._resolve_recipe(require.ref, graph_lock)
             except ConanException as e:
                 raise GraphMissingError(node, require, str(e))
@@ -14,7 +14,7 @@ class RangeResolver:
         self.resolved_ranges = {}
         self._resolve_prereleases = self._cache.new_config.get('core.version_ranges:resolve_prereleases')
 
-    def resolve(self, require, base_conanref, remotes, update):
+    def resolve(self, require, base_conanref, remotes, update, hidden=None):
         version_range = require.version_range
         if version_range is None:
             return
@@ -29,7 +29,7 @@ class RangeResolver:
         ref = require.ref
         search_ref = RecipeReference(ref.name, "*", ref.user, ref.channel)
 
-        resolved_ref = self._resolve_local(search_ref, version_range)
+        resolved_ref = self._resolve_local(search_ref, version_range, hidden)
         if resolved_ref is None or update:
             remote_resolved_ref = self._resolve_remote(search_ref, version_range, remotes, update)
             if resolved_ref is None or (remote_resolved_ref is not None and
@@ -45,7 +45,7 @@ class RangeResolver:
         self.resolved_ranges[require.ref] = resolved_ref
         require.ref = resolved_ref
 
-    def _resolve_local(self, search_ref, version_range):
+    def _resolve_local(self, search_ref, version_range, hidden=None):
         pattern = str(search_ref)
         local_found = self._cached_cache.get(pattern)
         if local_found is None:
@@ -54,6 +54,10 @@ class RangeResolver:
             # TODO: This is still necessary to filter user/channel, until search_recipes is fixed
             local_found = [ref for ref in local_found if ref.user == search_ref.user
                            and ref.channel == search_ref.channel]
+            if hidden is not None:  # In the cache, but not reached yet by the graph expansion
+                local_found = [ref for ref in local_found if ref != hidden]
+            # Sorted once, newest first, for all the ranges of the same package
+            local_found = list(reversed(sorted(local_found)))
             self._cached_cache[pattern] = local_found
         if local_found:
             return self._resolve_version(version_range, local_found, self._resolve_prereleases)
@@ -67,6 +71,8 @@ class RangeResolver:
             # TODO: This is still necessary to filter user/channel, until search_recipes is fixed
             results = [ref for ref in results if ref.user == search_ref.user
                        and ref.channel == search_ref.channel]
+            # Sorted once, newest first, for all the ranges of the same package
+            results = list(reversed(sorted(results)))
             pattern_cached.update({remote.name: results})
         return results
 
@@ -82,12 +88,14 @@ class RangeResolver:
                 else:
                     update_candidates.append(resolved_version)
         if len(update_candidates) > 0:  # pick latest from already resolved candidates
+            update_candidates = list(reversed(sorted(update_candidates)))
             resolved_version = self._resolve_version(version_range, update_candidates,
                                                      self._resolve_prereleases)
             return resolved_version
 
     @staticmethod
     def _resolve_version(version_range, refs_found, resolve_prereleases):
-        for ref in reversed(sorted(refs_found)):
+        # refs_found must be already sorted, newest first
+        for ref in refs_found:
             if version_range.contains(ref.version, resolve_prereleases):
                 return ref
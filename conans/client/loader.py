@@ -46,9 +46,10 @@ class ConanFileLoader:
         if cached:
             conanfile = cached[0](display)
             conanfile._conan_helpers = self._conanfile_helpers
-            if hasattr(conanfile, "init") and callable(conanfile.init):
+            init = getattr(conanfile, "init", None)
+            if callable(init):
                 with conanfile_exception_formatter(conanfile, "init"):
-                    conanfile.init()
+                    init()
             return conanfile, cached[1]
 
         try:
@@ -71,9 +72,10 @@ class ConanFileLoader:
             result = conanfile(display)
 
             result._conan_helpers = self._conanfile_helpers
-            if hasattr(result, "init") and callable(result.init):
+            init = getattr(result, "init", None)
+            if callable(init):
                 with conanfile_exception_formatter(result, "init"):
-                    result.init()
+                    init()
             return result, module
         except ConanException as e:
             raise ConanException("Error loading conanfile at '{}': {}".format(conanfile_path, e))
@@ -357,6 +357,9 @@ class Options:
         assert isinstance(profile_options, Options)
 
         for defined_options in down_options, profile_options:
+            if not defined_options._deps_package_options and \
+                    not defined_options._package_options._data:
+                continue  # Nothing defined, common if recipes and profiles have no options
             if own_ref is None or own_ref.name is None:
                 # If the current package doesn't have a name defined, is a pure consumer without name
                 # Get the non-scoped options, plus the "all-matching=*" pattern
@@ -1,6 +1,7 @@
 
 import fnmatch
 import re
+import sys
 from functools import total_ordering
 
 from conans.errors import ConanException
@@ -14,10 +15,12 @@ class RecipeReference:
     Should be enough to locate a recipe in the cache or in a server
     Validation will be external to this class, at specific points (export, api, etc)
     """
+    __slots__ = ("name", "version", "user", "channel", "revision", "timestamp")
 
     def __init__(self, name=None, version=None, user=None, channel=None, revision=None,
                  timestamp=None):
-        self.name = name
+        # Interned, as names are hashed and compared all the time while expanding the graph
+        self.name = sys.intern(name) if isinstance(name, str) else name
         if version is not None and not isinstance(version, Version):
             version = Version(version)
         self.version = version  # This MUST be a version if we want to be able to order
@@ -163,9 +166,12 @@ class RecipeReference:
             pattern = pattern[1:]
             negate = True
 
+        # This is called for every options pattern of every node, build the str only once
+        ref_str = str(self)
         condition = ((pattern == "&" and is_consumer) or
-                      fnmatch.fnmatchcase(str(self), pattern) or
-                      fnmatch.fnmatchcase(self.repr_notime(), pattern))
+                     fnmatch.fnmatchcase(ref_str, pattern) or
+                     (self.revision is not None and
+                      fnmatch.fnmatchcase("{}#{}".format(ref_str, self.revision), pattern)))
         if negate:
             return not condition
         return condition
@@ -1,5 +1,3 @@
-from collections import OrderedDict
-
 from conans.errors import ConanException
 from conans.model.pkg_type import PackageType
 from conans.model.recipe_ref import RecipeReference
@@ -9,6 +7,10 @@ from conans.model.version_range import VersionRange
 class Requirement:
     """ A user definition of a requires in a conanfile
     """
+    __slots__ = ("ref", "_headers", "_libs", "_build", "_run", "_visible", "_transitive_headers",
+                 "_transitive_libs", "_test", "_package_id_mode", "_force", "_override",
+                 "_direct", "options", "overriden_ref", "override_ref", "is_test")
+
     def __init__(self, ref, *, headers=None, libs=None, build=False, run=None, visible=None,
                  transitive_headers=None, transitive_libs=None, test=None, package_id_mode=None,
                  force=None, override=None, direct=None, options=None):
@@ -37,13 +39,9 @@ class Requirement:
     def skip(self):
         return not (self.headers or self.libs or self.run or self.build)
 
-    @staticmethod
-    def _default_if_none(field, default_value):
-        return field if field is not None else default_value
-
     @property
     def headers(self):
-        return self._default_if_none(self._headers, True)
+        return self._headers if self._headers is not None else True
 
     @headers.setter
     def headers(self, value):
@@ -51,7 +49,7 @@ class Requirement:
 
     @property
     def libs(self):
-        return self._default_if_none(self._libs, True)
+        return self._libs if self._libs is not None else True
 
     @libs.setter
     def libs(self, value):
@@ -59,7 +57,7 @@ class Requirement:
 
     @property
     def visible(self):
-        return self._default_if_none(self._visible, True)
+        return self._visible if self._visible is not None else True
 
     @visible.setter
     def visible(self, value):
@@ -67,7 +65,7 @@ class Requirement:
 
     @property
     def test(self):
-        return self._default_if_none(self._test, False)
+        return self._test if self._test is not None else False
 
     @test.setter
     def test(self, value):
@@ -75,7 +73,7 @@ class Requirement:
 
     @property
     def force(self):
-        return self._default_if_none(self._force, False)
+        return self._force if self._force is not None else False
 
     @force.setter
     def force(self, value):
@@ -83,7 +81,7 @@ class Requirement:
 
     @property
     def override(self):
-        return self._default_if_none(self._override, False)
+        return self._override if self._override is not None else False
 
     @override.setter
     def override(self, value):
@@ -91,7 +89,7 @@ class Requirement:
 
     @property
     def direct(self):
-        return self._default_if_none(self._direct, True)
+        return self._direct if self._direct is not None else True
 
     @direct.setter
     def direct(self, value):
@@ -107,7 +105,7 @@ class Requirement:
 
     @property
     def run(self):
-        return self._default_if_none(self._run, False)
+        return self._run if self._run is not None else False
 
     @run.setter
     def run(self, value):
@@ -138,7 +136,7 @@ class Requirement:
         self._package_id_mode = value
 
     def __repr__(self):
-        return repr(self.__dict__)
+        return repr({k: getattr(self, k) for k in self.__slots__})
 
     def __str__(self):
         traits = 'build={}, headers={}, libs={}, '  \
@@ -209,13 +207,13 @@ class Requirement:
             set_if_none("_transitive_libs", True)
 
     def __hash__(self):
-        return hash((self.ref.name, self.build))
+        return hash((self.ref.name, self._build))
 
     def __eq__(self, other):
         """If the name is the same and they are in the same context, and if both of them are
         propagating includes or libs or run info or both are visible or the reference is the same,
         we consider the requires equal, so they can conflict"""
-        return (self.ref.name == other.ref.name and self.build == other.build and
+        return (self.ref.name == other.ref.name and self._build == other._build and
                 (self.override or  # an override with same name and context, always match
                  (self.headers and other.headers) or
                  (self.libs and other.libs) or
@@ -428,7 +426,7 @@ class Requirements:
     """
     def __init__(self, declared=None, declared_build=None, declared_test=None,
                  declared_build_tool=None):
-        self._requires = OrderedDict()
+        self._requires = {}
         # Construct from the class definitions
         if declared is not None:
             if isinstance(declared, str):
@@ -555,7 +553,8 @@ class Requirements:
         if ref is None:
             return
         # FIXME: This raise_if_duplicated is ugly, possibly remove
-        ref = RecipeReference.loads(ref)
+        if not isinstance(ref, RecipeReference):  # Profile [tool_requires] are already parsed
+            ref = RecipeReference.loads(ref)
         req = Requirement(ref, headers=False, libs=False, build=True, run=run, visible=visible,
                           package_id_mode=package_id_mode, options=options, override=override)
         if raise_if_duplicated and self._requires.get(req):
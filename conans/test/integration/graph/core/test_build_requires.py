@@ -1,10 +1,12 @@
 import textwrap
 
+import mock
 import pytest
 
 from parameterized import parameterized
 
 from conans.client.graph.graph_error import GraphConflictError, GraphLoopError, GraphRuntimeError
+from conans.client.loader import parse_conanfile
 from conans.model.recipe_ref import RecipeReference
 from conans.test.integration.graph.core.graph_manager_base import GraphManagerTest
 from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient
@@ -157,6 +159,31 @@ class BuildRequiresGraphTest(GraphManagerTest):
         _check_transitive(lib, [(cmake, False, False, True, True)])
         _check_transitive(cmake, [(zlib, True, True, False, False)])
 
+    def test_build_require_recipe_loaded_once(self):
+        # app -> liba -(br)-> cmake
+        #    \-> libb -(br)-> cmake
+        # Both cmake nodes must have their own conanfile instance, as they are configured
+        # independently, but the recipe file should only be parsed once
+        self._cache_recipe("cmake/0.1", GenConanfile())
+        self._cache_recipe("liba/0.1", GenConanfile().with_tool_requires("cmake/0.1"))
+        self._cache_recipe("libb/0.1", GenConanfile().with_tool_requires("cmake/0.1"))
+        with mock.patch("conans.client.loader.parse_conanfile",
+                        wraps=parse_conanfile) as parse_mock:
+            deps_graph = self.build_graph(GenConanfile("app", "0.1").with_require("liba/0.1")
+                                                                    .with_require("libb/0.1"),
+                                          install=False)
+
+        self.assertEqual(5, len(deps_graph.nodes))
+        app = deps_graph.root
+        liba = app.dependencies[0].dst
+        libb = app.dependencies[1].dst
+        cmake1 = liba.dependencies[0].dst
+        cmake2 = libb.dependencies[0].dst
+        assert cmake1 is not cmake2
+        assert cmake1.conanfile is not cmake2.conanfile
+        # consumer + liba + libb + cmake
+        assert parse_mock.call_count == 4
+
 
 class TestBuildRequiresTransitivityDiamond(GraphManagerTest):
 
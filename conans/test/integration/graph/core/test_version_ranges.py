@@ -2,7 +2,6 @@ from collections import OrderedDict
 
 import pytest
 
-from conan.api.model import Remote
 from conans.client.graph.graph_error import GraphConflictError, GraphMissingError
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.integration.graph.core.graph_manager_base import GraphManagerTest
@@ -182,7 +181,6 @@ class TestVersionRangesDiamond(GraphManagerTest):
 
         self.assertEqual(4, len(deps_graph.nodes))
         app = deps_graph.root
-        app.enabled_remotes = [Remote("foo", None)]
         libb = app.dependencies[0].dst
         libc = app.dependencies[1].dst
         liba = libb.dependencies[0].dst
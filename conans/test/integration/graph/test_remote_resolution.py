@@ -1,5 +1,8 @@
 import textwrap
+import threading
+from unittest.mock import patch
 
+from conans.client.graph.proxy import ConanProxy
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.tools import TestClient
 
@@ -44,3 +47,114 @@ def test_build_requires_ranges():
     assert "pkgb/1.0: CMAKEVER: 1.0!!" in client.out
     assert "pkga/1.0: REQUIRE cmake/0.5: cmake/0.5" in client.out
     assert "pkga/1.0: CMAKEVER: 0.5!!" in client.out
+
+
+def test_parallel_recipes_download():
+    # app -> pkga -> pkgc
+    #    \-> pkgb ---/
+    client = TestClient(default_server_user=True)
+    client.save({"pkgc/conanfile.py": GenConanfile("pkgc", "1.0"),
+                 "pkgb/conanfile.py": GenConanfile("pkgb", "1.0").with_requires("pkgc/1.0"),
+                 "pkga/conanfile.py": GenConanfile("pkga", "1.0").with_requires("pkgc/1.0"),
+                 "app/conanfile.py": GenConanfile().with_requires("pkga/1.0", "pkgb/1.0")})
+    client.run("export pkgc")
+    client.run("export pkgb")
+    client.run("export pkga")
+    client.run("upload * -c -r default")
+    client.run("remove * -c")
+
+    client.run("graph info app")
+    serial_output = client.out
+    client.run("remove * -c")
+
+    client.save_home({"global.conf": "core.graph:parallel_recipes=4"})
+    threads = {}
+    original_get_recipe = ConanProxy._get_recipe
+
+    def get_recipe(proxy, ref, *args, **kwargs):
+        threads.setdefault(ref.name, threading.current_thread())
+        return original_get_recipe(proxy, ref, *args, **kwargs)
+
+    with patch.object(ConanProxy, "_get_recipe", get_recipe):
+        client.run("graph info app")
+    assert "pkga/1.0: Downloaded recipe revision" in client.out
+    assert "pkgb/1.0: Downloaded recipe revision" in client.out
+    assert "pkgc/1.0: Downloaded recipe revision" in client.out
+    assert "pkgc/1.0#" in client.out
+    # The output of the background threads is written in the same order as serially
+    assert client.out == serial_output
+    # All of them are resolved in advance by the background threads
+    for name in ("pkga", "pkgb", "pkgc"):
+        assert threads[name] is not threading.main_thread()
+
+
+def test_parallel_recipes_forced_not_downloaded():
+    # app -> liba -> zlib/1.0
+    #   \---------> zlib/1.2 (force)
+    # zlib/1.0 is never resolved, neither in advance
+    client = TestClient(default_server_user=True)
+    client.save({"zlib/conanfile.py": GenConanfile("zlib"),
+                 "liba/conanfile.py": GenConanfile("liba", "1.0").with_requires("zlib/1.0"),
+                 "app/conanfile.py": GenConanfile().with_requirement("liba/1.0")
+                                                   .with_requirement("zlib/1.2", force=True)})
+    client.run("export zlib --version=1.2")
+    client.run("export liba")
+    client.run("upload * -c -r default")
+    client.run("remove * -c")
+
+    client.save_home({"global.conf": "core.graph:parallel_recipes=4"})
+    client.run("graph info app")
+    assert "liba/1.0: Downloaded recipe revision" in client.out
+    assert "zlib/1.2: Downloaded recipe revision" in client.out
+    assert "zlib/1.0: Not found in local cache" not in client.out
+    assert "zlib/1.0: Downloaded recipe revision" not in client.out
+    client.run("list zlib/*")
+    assert "zlib/1.0" not in client.out
+
+
+def test_parallel_recipes_ranges_not_affected():
+    # app -> liba -(tool_requires)-> zlib/[>=1.0]
+    #   \---------> zlib/1.0
+    # The range is resolved before zlib/1.0 is reached, when it is not in the cache yet, so it
+    # resolves to zlib/1.2 from the remote, even if zlib/1.0 has been downloaded in advance
+    client = TestClient(default_server_user=True)
+    client.save({"zlib/conanfile.py": GenConanfile("zlib"),
+                 "liba/conanfile.py": GenConanfile("liba", "1.0").with_tool_requires("zlib/[>=1.0]"),
+                 "app/conanfile.py": GenConanfile().with_requires("liba/1.0", "zlib/1.0")})
+    client.run("export zlib --version=1.0")
+    client.run("export zlib --version=1.2")
+    client.run("export liba")
+    client.run("upload * -c -r default")
+    client.run("remove * -c")
+
+    client.run("graph info app")
+    serial_output = client.out
+    assert "zlib/1.2: Downloaded recipe revision" in serial_output
+    client.run("remove * -c")
+
+    client.save_home({"global.conf": "core.graph:parallel_recipes=4"})
+    client.run("graph info app")
+    assert client.out == serial_output
+
+
+def test_parallel_recipes_missing():
+    # app -> pkga -> zlib/1.0 (missing in the remote)
+    #    \-> pkgb
+    # The failure of the resolution in advance is reported once, and in the serial order
+    client = TestClient(default_server_user=True)
+    client.save({"pkga/conanfile.py": GenConanfile("pkga", "1.0").with_requires("zlib/1.0"),
+                 "pkgb/conanfile.py": GenConanfile("pkgb", "1.0"),
+                 "app/conanfile.py": GenConanfile().with_requires("pkga/1.0", "pkgb/1.0")})
+    client.run("export pkga")
+    client.run("export pkgb")
+    client.run("upload * -c -r default")
+    client.run("remove * -c")
+
+    client.run("graph info app", assert_error=True)
+    serial_output = client.out
+    client.run("remove * -c")
+
+    client.save_home({"global.conf": "core.graph:parallel_recipes=4"})
+    client.run("graph info app", assert_error=True)
+    assert client.out.count("zlib/1.0: Not found in local cache, looking in remotes...") == 1
+    assert client.out == serial_output